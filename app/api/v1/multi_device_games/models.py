@@ -102,7 +102,7 @@ class MultiDeviceGameModel(BaseModel):
                     "secret_word": "apple",
                     "category": Category.GENERAL,
                     "spy_count": SpyCount.SINGLE,
-                    "qr_code_url": "https://example.com/qr.jpg",
+                    "qr_code_url": "https://example.com/qr.png",
                     "players": [
                         {
                             "user_id": "UUID",
@@ -3,7 +3,6 @@ from typing import AsyncContextManager
 
 from fastapi import FastAPI
 from pydantic import ValidationError
-from redis.asyncio import Redis
 from starlette import status
 from starlette.requests import Request
 from starlette.responses import JSONResponse
@@ -20,6 +19,7 @@ from app.assets.objects.single_device_active_player import SingleDeviceActivePla
 from app.assets.objects.single_device_game import SingleDeviceGame
 from app.database.database import Database
 from app.logging import logger
+from app.redis import create_redis, create_redis_pool
 from config import config
 
 
@@ -34,17 +34,23 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncContextManager[None]:
     """
 
     yield
+    await fastapi_app.state.qr_codes.close()
     await fastapi_app.state.redis.close()
+    await fastapi_app.state.redis_pool.disconnect()
 
 
 database = Database.from_dsn(config.database_dsn.get_secret_value())
-redis = Redis.from_url(config.redis_dsn.get_secret_value())
+
+redis_pool = create_redis_pool(config.redis_dsn.get_secret_value())
+redis = create_redis(redis_pool)
+
 s3_config = S3Config.from_config(config)
 
 app = FastAPI(title=config.TITLE, lifespan=lifespan)
 
 app.state.config = config
 app.state.database = database
+app.state.redis_pool = redis_pool
 app.state.redis = redis
 
 app.state.secret_words = RedisController[SecretWordsQueue](redis)
@@ -1,14 +1,133 @@
-from json import dumps, loads
-from typing import Any, Tuple, List, TypeVar, Callable, Dict, Generic
+from asyncio import Queue, Task, get_running_loop
+from functools import lru_cache
+from typing import Any, AsyncIterator, Tuple, List, TypeVar, Callable, Dict, Generic, Iterable
 
+from orjson import dumps, loads
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
 
 from app.assets.controllers.abstract import AbstractController
 from app.assets.objects.redis import AbstractRedisObject
+from app.logging import logger
 from config import config
 
 T = TypeVar('T', bound=AbstractRedisObject)
 
+# Merges a partial JSON object into a stored JSON value without resending unchanged fields.
+# Keeps the key's TTL. Returns 0 if the key does not exist, so callers can fall back to a full set.
+_SET_FIELDS_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then
+    return 0
+end
+local value = cjson.decode(current)
+for name, field in pairs(cjson.decode(ARGV[1])) do
+    value[name] = field
+end
+redis.call('SET', KEYS[1], cjson.encode(value), 'KEEPTTL')
+return 1
+"""
+
+# Sets every key unless the guard key already exists, in one atomic step.
+# KEYS[1] is the guard; remaining keys pair with ARGV as value, TTL (0 for no expiry).
+# Returns 0 without writing anything if the guard key is present.
+_SET_UNLESS_EXISTS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+for i = 2, #KEYS do
+    local value = ARGV[(i - 2) * 2 + 1]
+    local ttl = tonumber(ARGV[(i - 2) * 2 + 2])
+    if ttl > 0 then
+        redis.call('SET', KEYS[i], value, 'EX', ttl)
+    else
+        redis.call('SET', KEYS[i], value)
+    end
+end
+return 1
+"""
+
+
+class PipelinedWriter:
+    """
+    Background writer for fire-and-forget Redis SET commands.
+
+    Queued writes are drained by a single background task which batches
+    everything accumulated so far into one pipeline, turning N independent
+    writes into roughly one Redis round-trip. Failed batches are logged
+    instead of raised, so callers must only queue writes which are
+    recoverable by other means.
+    """
+
+    MAX_BATCH_SIZE = 128
+    """
+    Maximum count of SET commands sent in a single pipeline.
+    """
+
+    def __init__(
+            self,
+            redis: Redis
+    ) -> None:
+        """
+        Initialize pipelined writer instance.
+
+        :param redis: Redis connection instance.
+        """
+
+        self._redis: Redis = redis
+        self._queue: Queue[Tuple[str, bytes, int | None]] = Queue()
+        self._task: Task | None = None
+
+    def put(
+            self,
+            key: str,
+            value: bytes,
+            *,
+            expire: int | None = None
+    ) -> None:
+        """
+        Queue a SET command without awaiting its acknowledgement.
+
+        :param key: Exact Redis key.
+        :param value: Serialized value to be set.
+        :param expire: Expiration time in seconds.
+        """
+
+        self._queue.put_nowait((key, value, expire))
+
+        if self._task is None or self._task.done():
+            self._task = get_running_loop().create_task(self._drain())
+
+    async def flush(self) -> None:
+        """
+        Wait until all queued writes have been sent.
+        """
+
+        if self._task is not None and not self._task.done():
+            await self._task
+
+    async def _drain(self) -> None:
+        """
+        Send all queued writes in pipelined batches.
+        """
+
+        while not self._queue.empty():
+            batch: List[Tuple[str, bytes, int | None]] = []
+
+            while not self._queue.empty() and len(batch) < self.MAX_BATCH_SIZE:
+                batch.append(self._queue.get_nowait())
+
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, value, expire in batch:
+                    pipe.set(key, value, ex=expire)
+
+                try:
+                    await pipe.execute()
+                except RedisError as error:
+                    logger.exception(error)
+
 
 class RedisController(AbstractController, Generic[T]):
     """
@@ -42,6 +161,113 @@ class RedisController(AbstractController, Generic[T]):
 
         self._redis: Redis = redis
         self._default_key: str = default_key or config.default_redis_key
+        self._key_prefix: str | None = None
+        self._set_fields_script: AsyncScript = redis.register_script(_SET_FIELDS_SCRIPT)
+        self._set_unless_exists_script: AsyncScript = redis.register_script(_SET_UNLESS_EXISTS_SCRIPT)
+        self._writer: PipelinedWriter = PipelinedWriter(redis)
+        self._key_for: Callable[[Any], str] = lru_cache(maxsize=4096)(self._format_key)
+
+    @property
+    def redis(self) -> Redis:
+        """
+        Redis connection instance, shared between all controllers.
+
+        Exposed for flows which pipeline commands across several controllers.
+
+        :return: Redis connection instance.
+        """
+
+        return self._redis
+
+    def key_for(
+            self,
+            primary_key: Any
+    ) -> str:
+        """
+        Generate the full Redis key for a primary key.
+
+        Keys are memoized per controller, so repeated operations on the same
+        object skip the UUID stringification and prefix concatenation.
+
+        :param primary_key: Primary key for the key to be generated.
+        :return: Generated Redis key.
+        """
+
+        return self._key_for(primary_key)
+
+    def _format_key(
+            self,
+            primary_key: Any
+    ) -> str:
+        """
+        Format the full Redis key for a primary key.
+
+        :param primary_key: Primary key for the key to be formatted.
+        :return: Formatted Redis key.
+        """
+
+        return self._key(str(primary_key))
+
+    def pipeline(
+            self,
+            *,
+            transaction: bool = True
+    ) -> Pipeline:
+        """
+        Create a pipeline on the shared Redis connection.
+
+        Commands from several controllers can be staged into it
+        and sent in a single round-trip.
+
+        :param transaction: Whether to wrap the pipeline into MULTI/EXEC.
+        :return: Pipeline instance.
+        """
+
+        return self._redis.pipeline(transaction=transaction)
+
+    def stage_set(
+            self,
+            pipe: Pipeline,
+            value: T,
+            *,
+            expire: int | None = None
+    ) -> None:
+        """
+        Stage a set of a value into a pipeline instead of sending it immediately.
+
+        :param pipe: Pipeline to stage the command into.
+        :param value: Value to be set.
+        :param expire: Expiration time in seconds.
+        """
+
+        pipe.set(self.key_for(value.primary_key), value.to_json_bytes(), ex=expire)
+
+    def from_serialized(
+            self,
+            serialized: str | bytes | None,
+            from_json_method: Callable[..., T] | None = None,
+            **kwargs: Any
+    ) -> T | None:
+        """
+        Reconstruct a Redis object from a raw serialized value, e.g. a pipelined GET reply.
+
+        :param serialized: Serialized value, can be None.
+        :param from_json_method: Method for converting JSON representation of value to a Redis object.
+        :param kwargs: Keyword arguments for convertion method.
+        :return: Value if present, None otherwise.
+        """
+
+        if serialized is None:
+            return None
+
+        if from_json_method is None:
+            from_json_method = self.object_class.from_json_and_controller
+
+        return from_json_method(
+            loads(serialized),
+            controller=self,
+            **kwargs
+        )
 
     @property
     def key(self) -> str:
@@ -70,7 +296,146 @@ class RedisController(AbstractController, Generic[T]):
         :param expire: Expiration time in seconds.
         """
 
-        await self._set(str(value.primary_key), value.to_json(), expire=expire)
+        if expire is not None:
+            await self._redis.set(self.key_for(value.primary_key), value.to_json_bytes(), ex=expire)
+        else:
+            await self._redis.set(self.key_for(value.primary_key), value.to_json_bytes())
+
+    def set_nowait(
+            self,
+            value: T,
+            *,
+            expire: int | None = None
+    ) -> None:
+        """
+        Set new value by a primary key without awaiting the Redis acknowledgement.
+
+        The write is queued into a background pipelined writer; failures are
+        logged instead of raised, so only recoverable values should be set this way.
+
+        :param value: Value to be set.
+        :param expire: Expiration time in seconds.
+        """
+
+        self._writer.put(
+            self.key_for(value.primary_key),
+            value.to_json_bytes(),
+            expire=expire
+        )
+
+    async def flush(self) -> None:
+        """
+        Wait until all writes queued by set_nowait() have been sent.
+        """
+
+        await self._writer.flush()
+
+    async def set_many(
+            self,
+            values: Iterable[T],
+            *,
+            expire: int | None = None
+    ) -> None:
+        """
+        Set several values in a single pipelined round-trip.
+
+        :param values: Values to be set.
+        :param expire: Expiration time in seconds, applied to every value.
+        """
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for value in values:
+                pipe.set(self.key_for(value.primary_key), value.to_json_bytes(), ex=expire)
+            await pipe.execute()
+
+    async def set_many_unless_exists(
+            self,
+            guard_key: str,
+            entries: Iterable[Tuple[str, bytes, int | None]]
+    ) -> bool:
+        """
+        Atomically set several exact keys unless a guard key already exists.
+
+        Runs as a single server-side script, so the existence check and the
+        writes happen in one round-trip with no race window in between.
+
+        :param guard_key: Exact Redis key whose presence aborts the writes.
+        :param entries: Exact Redis keys with serialized values and expiration times in seconds.
+        :return: True if the values were set, False if the guard key exists.
+        """
+
+        keys: List[str] = [guard_key]
+        args: List[Any] = []
+
+        for key, value, expire in entries:
+            keys.append(key)
+            args.append(value)
+            args.append(expire or 0)
+
+        return bool(await self._set_unless_exists_script(keys=keys, args=args))
+
+    async def get_many(
+            self,
+            primary_keys: Iterable[Any],
+            from_json_method: Callable[..., T] | None = None,
+            **kwargs: Any
+    ) -> Tuple[T | None, ...]:
+        """
+        Retrieve several values in a single MGET round-trip.
+
+        :param primary_keys: Primary keys for the values to be retrieved.
+        :param from_json_method: Method for converting JSON representation of value to a Redis object.
+        :param kwargs: Keyword arguments for convertion method.
+        :return: Tuple of values in key order, None for missing keys.
+        """
+
+        keys: List[str] = [self.key_for(primary_key) for primary_key in primary_keys]
+
+        if not keys:
+            return ()
+
+        return tuple(
+            self.from_serialized(serialized, from_json_method, **kwargs)
+            for serialized in await self._redis.mget(keys)
+        )
+
+    async def remove_many(
+            self,
+            primary_keys: Iterable[Any]
+    ) -> None:
+        """
+        Remove several values in a single DEL round-trip.
+
+        :param primary_keys: Primary keys for the values to be removed.
+        """
+
+        keys: List[str] = [self.key_for(primary_key) for primary_key in primary_keys]
+
+        if keys:
+            await self._redis.delete(*keys)
+
+    async def set_fields(
+            self,
+            primary_key: Any,
+            fields: Dict[str, Any]
+    ) -> bool:
+        """
+        Update only the provided fields of an already stored value.
+
+        Merges fields into the stored JSON atomically on the Redis side,
+        avoiding a full re-serialization round-trip of unchanged fields.
+
+        :param primary_key: Primary key for the value to be updated.
+        :param fields: JSON-Serializable dictionary of field names and new values.
+        :return: True if the value exists and was updated, False otherwise.
+        """
+
+        return bool(
+            await self._set_fields_script(
+                keys=[self.key_for(primary_key)],
+                args=[dumps(fields)]
+            )
+        )
 
     async def get(
             self,
@@ -87,16 +452,8 @@ class RedisController(AbstractController, Generic[T]):
         :return: Value if exists, None otherwise.
         """
 
-        value: Dict[str, Any] | None = await self._get(str(primary_key))
-
-        if from_json_method is None:
-            from_json_method = self.object_class.from_json_and_controller
-
-        return None if value is None else from_json_method(
-            value,
-            controller=self,
-            **kwargs
-        )
+        serialized: bytes | None = await self._redis.get(self.key_for(primary_key))
+        return self.from_serialized(serialized, from_json_method, **kwargs)
 
     async def exists(
             self,
@@ -109,7 +466,7 @@ class RedisController(AbstractController, Generic[T]):
         :return: True if exists, False otherwise.
         """
 
-        return await self._exists(str(primary_key))
+        return bool(await self._redis.exists(self.key_for(primary_key)))
 
     async def remove(
             self,
@@ -121,7 +478,7 @@ class RedisController(AbstractController, Generic[T]):
         :param primary_key: Primary key for the value to be removed.
         """
 
-        await self._remove(str(primary_key))
+        await self._redis.delete(self.key_for(primary_key))
 
     async def all(
             self,
@@ -162,6 +519,64 @@ class RedisController(AbstractController, Generic[T]):
 
         return tuple(values)
 
+    async def iter_all(
+            self,
+            *,
+            count: int | None = None,
+            from_json_method: Callable[..., T] | None = None,
+            **kwargs: Any
+    ) -> AsyncIterator[Tuple[T, ...]]:
+        """
+        Iterate over all values in batches driven by a server-side SCAN cursor.
+
+        Unlike all(), walks the keyspace without limit/offset re-scanning:
+        keys stream in from SCAN and each batch is fetched with a single MGET.
+
+        :param count: Count of values to be retrieved in each batch, defaults to 100.
+        :param from_json_method: Method for converting JSON representation of value to a Redis object.
+        :param kwargs: Keyword arguments for convertion method.
+        :return: Async iterator of Redis object batches.
+        """
+
+        if count is None:
+            count = 100
+
+        keys: List[bytes] = []
+
+        async for key in self._redis.scan_iter(match=self._pattern(), count=count):
+            keys.append(key)
+
+            if len(keys) >= count:
+                yield await self._load_keys(keys, from_json_method, **kwargs)
+                keys = []
+
+        if keys:
+            yield await self._load_keys(keys, from_json_method, **kwargs)
+
+    async def _load_keys(
+            self,
+            keys: List[bytes],
+            from_json_method: Callable[..., T] | None = None,
+            **kwargs: Any
+    ) -> Tuple[T, ...]:
+        """
+        Retrieve values by exact Redis keys with a single MGET round-trip.
+
+        :param keys: Exact Redis keys.
+        :param from_json_method: Method for converting JSON representation of value to a Redis object.
+        :param kwargs: Keyword arguments for convertion method.
+        :return: Tuple of Redis objects, missing and invalid values omitted.
+        """
+
+        return tuple(
+            value
+            for value in (
+                self.from_serialized(serialized, from_json_method, **kwargs)
+                for serialized in await self._redis.mget(keys)
+            )
+            if value is not None
+        )
+
     def _key(self, *args: str, exact: bool = False) -> str:
         """
         Generate a Redis key using a sequence of args.
@@ -171,8 +586,14 @@ class RedisController(AbstractController, Generic[T]):
         :return: Generated Redis key.
         """
 
-        keys: Tuple[str, ...] = (*args,) if exact else (self._default_key, self.key, *args)
-        return ":".join(keys)
+        if exact:
+            return ":".join(args)
+
+        # The prefix never changes, so it is composed lazily once per controller
+        if self._key_prefix is None:
+            self._key_prefix = f"{self._default_key}:{self.key}"
+
+        return ":".join((self._key_prefix, *args))
 
     def _pattern(self, *, exact: bool = False) -> str:
         """
@@ -184,21 +605,6 @@ class RedisController(AbstractController, Generic[T]):
 
         return "" if exact else f"*{self._default_key}:{self.key}*"
 
-    async def _set(self, key: str, value: Any, *, expire: int | None = None, exact_key: bool = False) -> None:
-        """
-        Set value by a primary key and JSON-Serializable value.
-
-        :param key: Primary key.
-        :param value: Value to be set.
-        :param expire: Expiration time in seconds.
-        :param exact_key: Whether to omit default and Redis object class keys on the prefix.
-        """
-
-        if expire is not None:
-            await self._redis.set(self._key(key, exact=exact_key), dumps(value), ex=expire)
-        else:
-            await self._redis.set(self._key(key, exact=exact_key), dumps(value))
-
     async def _get(self, key: str, *, exact_key: bool = False) -> Any:
         """
         Retrieve a JSON-Serializable value by a primary key.
@@ -208,30 +614,9 @@ class RedisController(AbstractController, Generic[T]):
         :return: JSON-Serializable value if exists, None otherwise.
         """
 
-        serialized: str = await self._redis.get(self._key(key, exact=exact_key))
+        serialized: bytes | None = await self._redis.get(self._key(key, exact=exact_key))
         return loads(serialized) if serialized is not None else None
 
-    async def _exists(self, key: str, *, exact_key: bool = False) -> bool:
-        """
-        Check if a primary key exists.
-
-        :param key: Primary key.
-        :param exact_key: Whether to omit default and Redis object class keys on the prefix.
-        :return: True if exists, False otherwise.
-        """
-
-        return bool(await self._redis.exists(self._key(key, exact=exact_key)))
-
-    async def _remove(self, key: str, *, exact_key: bool = False) -> None:
-        """
-        Remove value by a primary key.
-
-        :param key: Primary key.
-        :param exact_key: Whether to omit default and Redis object class keys on the prefix.
-        """
-
-        await self._redis.delete(self._key(key, exact=exact_key))
-
     async def _get_keys(
             self,
             *,
@@ -1,5 +1,5 @@
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator, TypeVar, Any, Generic, Self
+from asyncio import Lock, Semaphore, gather
+from typing import Dict, Iterable, Set, TypeVar, Any, Generic, Self
 
 from aiobotocore.client import AioBaseClient
 from aiobotocore.session import get_session
@@ -99,6 +99,9 @@ class S3Controller(AbstractController, Generic[T]):
         """
 
         self._config = config
+        self._clients: Dict[str | None, AioBaseClient] = {}
+        self._clients_lock = Lock()
+        self._known_buckets: Set[str] = set()
 
     @property
     def bucket(self) -> str:
@@ -126,6 +129,63 @@ class S3Controller(AbstractController, Generic[T]):
 
         await self._set(self.bucket, value.primary_key, value.content)
 
+    async def set_many(
+            self,
+            values: Iterable[T],
+            *,
+            concurrency: int = 8
+    ) -> None:
+        """
+        Upload several files over a single client session with concurrent requests.
+
+        :param values: Values to be uploaded.
+        :param concurrency: Maximum number of uploads in flight at once.
+        """
+
+        values = tuple(values)
+
+        if not values:
+            return
+
+        client: AioBaseClient = await self._client()
+        await self._ensure_bucket(client, self.bucket)
+
+        semaphore = Semaphore(concurrency)
+
+        async def upload(value: T) -> None:
+            async with semaphore:
+                await client.put_object(Bucket=self.bucket, Key=value.primary_key, Body=value.content)
+
+        await gather(*map(upload, values))
+
+    async def remove_many(
+            self,
+            primary_keys: Iterable[Any]
+    ) -> None:
+        """
+        Remove several values by primary keys with a single batch request.
+
+        :param primary_keys: Primary keys for the values to be removed.
+        """
+
+        primary_keys = tuple(primary_keys)
+
+        if not primary_keys:
+            return
+
+        client: AioBaseClient = await self._client()
+        await self._ensure_bucket(client, self.bucket)
+
+        # delete_objects accepts at most 1000 keys per request
+        for start in range(0, len(primary_keys), 1000):
+            await client.delete_objects(
+                Bucket=self.bucket,
+                Delete={
+                    "Objects": [{"Key": key} for key in primary_keys[start:start + 1000]],
+                    "Quiet": True
+                }
+            )
+
     async def get(
             self,
             primary_key: Any
@@ -195,13 +255,10 @@ class S3Controller(AbstractController, Generic[T]):
         :param content: Data in bytes.
         """
 
-        async with self._get_client() as client:
-            try:
-                await client.head_bucket(Bucket=bucket)
-            except ClientError:
-                await client.create_bucket(Bucket=bucket)
+        client: AioBaseClient = await self._client()
+        await self._ensure_bucket(client, bucket)
 
-            await client.put_object(Bucket=bucket, Key=key, Body=content)
+        await client.put_object(Bucket=bucket, Key=key, Body=content)
 
     async def _get(
             self,
@@ -216,16 +273,13 @@ class S3Controller(AbstractController, Generic[T]):
         :return: Data in bytes if exists, None otherwise.
         """
 
-        async with self._get_client() as client:
-            try:
-                await client.head_bucket(Bucket=bucket)
-            except ClientError:
-                await client.create_bucket(Bucket=bucket)
+        client: AioBaseClient = await self._client()
+        await self._ensure_bucket(client, bucket)
 
-            try:
-                result: dict = await client.get_object(Bucket=bucket, Key=key)
-            except ClientError:
-                return
+        try:
+            result: dict = await client.get_object(Bucket=bucket, Key=key)
+        except ClientError:
+            return
 
         return await result.get("Body").read()
 
@@ -242,17 +296,14 @@ class S3Controller(AbstractController, Generic[T]):
         :return: True if exists, False otherwise.
         """
 
-        async with self._get_client() as client:
-            try:
-                await client.head_bucket(Bucket=bucket)
-            except ClientError:
-                await client.create_bucket(Bucket=bucket)
+        client: AioBaseClient = await self._client()
+        await self._ensure_bucket(client, bucket)
 
-            try:
-                await client.head_object(Bucket=bucket, Key=key)
-                return True
-            except ClientError:
-                return False
+        try:
+            await client.head_object(Bucket=bucket, Key=key)
+            return True
+        except ClientError:
+            return False
 
     async def _remove(
             self,
@@ -266,13 +317,10 @@ class S3Controller(AbstractController, Generic[T]):
         :param key: File key.
         """
 
-        async with self._get_client() as client:
-            try:
-                await client.head_bucket(Bucket=bucket)
-            except ClientError:
-                await client.create_bucket(Bucket=bucket)
+        client: AioBaseClient = await self._client()
+        await self._ensure_bucket(client, bucket)
 
-            await client.delete_object(Bucket=bucket, Key=key)
+        await client.delete_object(Bucket=bucket, Key=key)
 
     async def _url(
             self,
@@ -293,36 +341,86 @@ class S3Controller(AbstractController, Generic[T]):
         if expire is None:
             expire = 3600
 
-        async with self._get_client(endpoint_url=self._config.remote_dsn) as client:
-            try:
-                url: str = await client.generate_presigned_url(
-                    "get_object",
-                    Params={"Bucket": bucket, "Key": key},
-                    ExpiresIn=expire
-                )
-            except ClientError:
-                return
+        client: AioBaseClient = await self._client(endpoint_url=self._config.remote_dsn)
+
+        try:
+            url: str = await client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": bucket, "Key": key},
+                ExpiresIn=expire
+            )
+        except ClientError:
+            return
 
         return url
 
-    @asynccontextmanager
-    async def _get_client(
+    async def _ensure_bucket(
+            self,
+            client: AioBaseClient,
+            bucket: str
+    ) -> None:
+        """
+        Make sure a bucket exists, probing the storage only on its first use.
+
+        A bucket never disappears on its own once seen,
+        so the existence round-trip is paid once per process, not per operation.
+
+        :param client: S3 client instance.
+        :param bucket: Bucket name.
+        """
+
+        if bucket in self._known_buckets:
+            return
+
+        try:
+            await client.head_bucket(Bucket=bucket)
+        except ClientError:
+            await client.create_bucket(Bucket=bucket)
+
+        self._known_buckets.add(bucket)
+
+    async def _client(
             self,
             *,
             endpoint_url: str | None = None
-    ) -> AsyncGenerator[AioBaseClient, None]:
+    ) -> AioBaseClient:
         """
-        Generate an S3 client session.
+        Retrieve the shared S3 client for an endpoint, creating it on first use.
+
+        Client construction resolves endpoints, builds signers and opens
+        a connection pool, so one client per endpoint is kept
+        for the controller's lifetime instead of being rebuilt per request.
+
         :param endpoint_url: Optional endpoint URL for S3 client.
-        :return: S3 client session.
-        """
-
-        session = get_session()
-        async with session.create_client(
-                "s3",
-                endpoint_url=endpoint_url or self._config.dsn,
-                region_name=self._config.region,
-                aws_access_key_id=self._config.username,
-                aws_secret_access_key=self._config.password
-        ) as client:
-            yield client
+        :return: S3 client instance.
+        """
+
+        client: AioBaseClient | None = self._clients.get(endpoint_url)
+
+        if client is None:
+            async with self._clients_lock:
+                client = self._clients.get(endpoint_url)
+
+                if client is None:
+                    client = await get_session().create_client(
+                        "s3",
+                        endpoint_url=endpoint_url or self._config.dsn,
+                        region_name=self._config.region,
+                        aws_access_key_id=self._config.username,
+                        aws_secret_access_key=self._config.password
+                    ).__aenter__()
+                    self._clients[endpoint_url] = client
+
+        return client
+
+    async def close(self) -> None:
+        """
+        Close all shared S3 clients.
+        """
+
+        async with self._clients_lock:
+            clients = tuple(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            await client.__aexit__(None, None, None)
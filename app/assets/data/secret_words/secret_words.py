@@ -1,23 +1,38 @@
-from typing import Dict, Set, List
+from typing import Dict, FrozenSet, List, Tuple
 
 from app.assets.enums.category import Category
 
-_secret_words: Dict[Category, Set[str]] = {}
-_categories: Set[Category] = set(Category(category) for category in Category)
+# Per-category word data, loaded once at import into immutable pairs:
+# a frozenset for membership checks and subtraction,
+# and a tuple for indexed random draws.
+_secret_words: Dict[Category, FrozenSet[str]] = {}
+_secret_word_choices: Dict[Category, Tuple[str, ...]] = {}
 
-for category in _categories:
+for category in Category:
     filename: str = f"{category.lower()}.txt"
     with open(f"app/assets/data/secret_words/{filename}", "r", encoding="utf-8") as file:
         entries: List[str] = file.read().splitlines()
-    _secret_words[category] = set(entries)
+    _secret_word_choices[category] = tuple(entries)
+    _secret_words[category] = frozenset(entries)
 
 
-def get_secret_words(category: Category = Category.GENERAL) -> Set[str] | None:
+def get_secret_words(category: Category = Category.GENERAL) -> FrozenSet[str] | None:
     """
     Retrieve a set of secret word tags by word category.
 
     :param category: Word category.
-    :return: A set of secret word tags if a category exists, otherwise None.
+    :return: A frozenset of secret word tags if a category exists, otherwise None.
     """
 
     return _secret_words.get(category)
+
+
+def get_secret_word_choices(category: Category = Category.GENERAL) -> Tuple[str, ...] | None:
+    """
+    Retrieve an indexable tuple of secret word tags by word category.
+
+    :param category: Word category.
+    :return: A tuple of secret word tags if a category exists, otherwise None.
+    """
+
+    return _secret_word_choices.get(category)
@@ -1,6 +1,30 @@
 from enum import StrEnum
-from random import shuffle, random
-from typing import Tuple, List, Self
+from functools import lru_cache
+from itertools import combinations
+from random import SystemRandom
+from typing import Tuple, Self
+
+# Single urandom-backed generator shared by all spy picks.
+_random = SystemRandom()
+
+
+@lru_cache(maxsize=None)
+def _index_combinations(
+        player_amount: int,
+        spy_amount: int
+) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Enumerate every sorted spy index tuple for a player count once.
+
+    The domain is tiny (bounded player amounts, at most two spies),
+    so each table is built lazily on first use and reused forever.
+
+    :param player_amount: Count of players.
+    :param spy_amount: Count of spies.
+    :return: Tuple of every possible spy index tuple.
+    """
+
+    return tuple(combinations(range(player_amount), spy_amount))
 
 
 class SpyCount(StrEnum):
@@ -26,23 +50,16 @@ class SpyCount(StrEnum):
         :return: Tuple of player indices.
         """
 
-        indices: List[int] = list(range(player_amount))
-        shuffle(indices)
-
-        selected_indices = []
-        selected: bool = False
-
         value: Self = self
 
         if value == self.RANDOM:
-            chance: float = random()
+            chance: float = _random.random()
 
             if chance < 0.1:
-                selected = True
-            else:
-                value = self.SINGLE if chance < 0.55 else self.DOUBLE
+                return ()
+
+            value = self.SINGLE if chance < 0.55 else self.DOUBLE
 
-        if not selected:
-            selected_indices: List[int] = indices[:1] if value == self.SINGLE else indices[:2]
+        spy_amount: int = 1 if value == self.SINGLE else 2
 
-        return tuple(sorted(selected_indices))
+        return _random.choice(_index_combinations(player_amount, spy_amount))
@@ -59,3 +59,16 @@ class AbstractObject(BaseModel, ABC, arbitrary_types_allowed=True):
         """
 
         return self.model_dump(mode="json")
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize an object instance straight to JSON bytes.
+
+        Skips the intermediate Python dictionary of to_json() and stringifies
+        UUIDs, enums and nested objects in a single pydantic-core pass.
+
+        :raise PydanticSerializationError: If serialization fails.
+        :return: A JSON document in a bytes object.
+        """
+
+        return self.__pydantic_serializer__.to_json(self)
@@ -1,10 +1,9 @@
-import asyncio
 from base64 import urlsafe_b64encode
 from typing import Any, ClassVar, Dict, List, Self, Tuple
 from uuid import UUID, uuid4
 
 from celery.result import AsyncResult
-from pydantic import Field, field_validator, field_serializer
+from pydantic import Field, PrivateAttr, TypeAdapter, ValidationError, field_validator, field_serializer
 
 from app.api.v1.exceptions.already_in_game import AlreadyInGameError
 from app.api.v1.exceptions.game_has_already_started import GameHasAlreadyStartedError
@@ -19,11 +18,17 @@ from app.assets.enums.spy_count import SpyCount
 from app.assets.objects.multi_device_active_player import MultiDeviceActivePlayer
 from app.assets.objects.multi_device_player import MultiDevicePlayer
 from app.assets.objects.qr_code import QRCode
-from app.assets.objects.redis import AbstractRedisObject
+from app.assets.objects.redis import AbstractRedisObject, MISSING_CONTROLLER
 from app.assets.objects.secret_words_queue import SecretWordsQueue
+from app.workers.dispatch import run_in_dispatch_thread
 from app.workers.tasks import generate_qr_code_task
 from config import config
 
+_players_adapter: TypeAdapter[List[MultiDevicePlayer]] = TypeAdapter(List[MultiDevicePlayer])
+"""
+Prebuilt adapter validating a whole player list in a single pydantic-core call.
+"""
+
 
 class MultiDeviceGame(AbstractRedisObject):
     """
@@ -32,9 +37,14 @@ class MultiDeviceGame(AbstractRedisObject):
 
     key: ClassVar[str] = "multi_device_game"
 
-    _players_controller: RedisController[MultiDeviceActivePlayer] | None = None
+    _players_controller: RedisController[MultiDeviceActivePlayer] = PrivateAttr(default=MISSING_CONTROLLER)
     """
-    Redis controller instance for active players.
+    Redis controller instance for active players. Defaults to a sentinel which raises on any use.
+    """
+
+    _game_id_str: str | None = PrivateAttr(default=None)
+    """
+    Cached string form of the game UUID.
     """
 
     host_id: UUID
@@ -77,39 +87,97 @@ class MultiDeviceGame(AbstractRedisObject):
     Is the game started.
     """
 
-    players: Dict[UUID, MultiDevicePlayer] = Field(default_factory=dict)
+    players: Dict[str, MultiDevicePlayer] = Field(default_factory=dict)
     """
-    Dictionary of all players.
+    Dictionary of all players, keyed by the string form of a user UUID.
     """
 
     @field_validator("players", mode="before")
-    def validate_players(cls, data: List[Dict[str, Any]]) -> Dict[UUID, MultiDevicePlayer]:
+    def validate_players(cls, data: List[Dict[str, Any]] | Dict[str, MultiDevicePlayer]) -> Dict[str, MultiDevicePlayer]:
         """
         Create a player dictionary from list.
 
-        :param data: JSON-Serialized list of players.
+        The whole list is validated in one pydantic-core call;
+        if any entry is invalid, players are revalidated one by one
+        so a single corrupt entry is skipped instead of dropping the game.
+
+        :param data: JSON-Serialized list of players, or an already built dictionary.
         :return: Dictionary of players.
         """
 
-        return {
-            player.user_id: player
-            for player in map(MultiDevicePlayer.from_json, data)
-            if player is not None
-        }
+        if isinstance(data, dict):
+            return data
+
+        try:
+            players: List[MultiDevicePlayer] = _players_adapter.validate_python(data)
+        except ValidationError:
+            players = [
+                player
+                for player in map(MultiDevicePlayer.from_json, data)
+                if player is not None
+            ]
+
+        return {str(player.user_id): player for player in players}
 
     @field_serializer("players")
-    def serialize_players(self, players: Dict[UUID, MultiDevicePlayer]) -> List[Dict[str, Any]]:
+    def serialize_players(self, players: Dict[str, MultiDevicePlayer]) -> List[MultiDevicePlayer]:
         """
-        Create a JSON-Serialized list of players.
+        Create a list of players to be serialized.
+
+        Player instances are returned as-is, so pydantic-core walks them
+        in a single C-level pass instead of a Python-level dump per player.
 
         :param players: Dictionary of players.
-        :return: JSON-Serialized list of players.
+        :return: List of players.
+        """
+
+        return list(players.values())
+
+    @classmethod
+    def from_json(
+            cls,
+            data: Dict[str, Any],
+            **kwargs: Any
+    ) -> Self | None:
+        """
+        Reconstruct a multi-device game instance from a JSON-Serialized dictionary.
+
+        Data read back from Redis was serialized by this class, so it is
+        reconstructed with direct conversion instead of full Pydantic validation.
+        Anything unexpected falls back to the validated path.
+
+        :param data: Dictionary to reconstruct an object instance.
+        :param kwargs: Any additional JSON-Serializable parameters.
+        :return: An object instance if reconstructed successfully, else None.
         """
 
-        return [
-            player.to_json()
-            for player in players.values()
-        ]
+        data.update(kwargs)
+
+        try:
+            players: Dict[str, MultiDevicePlayer] = {}
+
+            for item in data.get("players", ()):
+                role: str | None = item.get("role")
+                players[item["user_id"]] = MultiDevicePlayer.model_construct(
+                    user_id=UUID(item["user_id"]),
+                    telegram_id=item["telegram_id"],
+                    first_name=item["first_name"],
+                    role=None if role is None else PlayerRole(role)
+                )
+
+            return cls.model_construct(
+                host_id=UUID(data["host_id"]),
+                player_amount=data["player_amount"],
+                secret_word=data["secret_word"],
+                category=Category(data["category"]),
+                spy_count=SpyCount(data["spy_count"]),
+                qr_code_url=data.get("qr_code_url"),
+                game_id=UUID(data["game_id"]),
+                has_started=data["has_started"],
+                players=players
+            )
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return super().from_json(data)
 
     @property
     def primary_key(self) -> Any:
@@ -125,14 +193,24 @@ class MultiDeviceGame(AbstractRedisObject):
         """
         Players controller instance. A private parameter must be set after an object initialization.
 
-        :raise ValueError: If a controller instance is not set.
+        :raise ValueError: If a controller instance is not set, on first use.
         :return: Players controller instance.
         """
 
-        if self._players_controller is None:
-            raise ValueError("Players controller is not set")
         return self._players_controller
 
+    @property
+    def game_id_str(self) -> str:
+        """
+        String form of the game UUID, stringified once per instance.
+
+        :return: Game UUID as a string.
+        """
+
+        if self._game_id_str is None:
+            self._game_id_str = str(self.game_id)
+        return self._game_id_str
+
     @property
     def join_url(self) -> str:
         """
@@ -142,7 +220,7 @@ class MultiDeviceGame(AbstractRedisObject):
         """
 
         # Works the same as an aiogram payload encoding.
-        payload: str = f"{Payload.JOIN}:{self.game_id}"
+        payload: str = f"{Payload.JOIN}:{self.game_id_str}"
         encoded_payload: str = urlsafe_b64encode(payload.encode("utf-8")).decode("utf-8").replace("=", "")
         return config.telegram_bot_start_url.format(payload=encoded_payload)
 
@@ -226,7 +304,8 @@ class MultiDeviceGame(AbstractRedisObject):
             games_controller: RedisController[Self],
             players_controller: RedisController[MultiDeviceActivePlayer],
             secret_words_controller: RedisController[SecretWordsQueue],
-            players: Dict[UUID, MultiDevicePlayer] | None = None
+            players: Dict[str, MultiDevicePlayer] | None = None,
+            host_already_active: bool = False
     ) -> Self:
         """
         Host a new game.
@@ -244,15 +323,23 @@ class MultiDeviceGame(AbstractRedisObject):
         :param players_controller: Players controller instance.
         :param secret_words_controller: Secret words queue controller instance.
         :param players: Dictionary of players, can be None.
+        :param host_already_active: Whether the host's active player object is expected to exist
+            and should be overwritten instead of treated as a conflict.
 
         :raise AlreadyInGameError: If user is already in game.
         :return: New multi-device game instance.
         """
 
-        if await players_controller.exists(host_id):
+        # Both pre-check reads share one pipelined round-trip
+        async with players_controller.redis.pipeline(transaction=False) as pipe:
+            pipe.exists(players_controller.key_for(host_id))
+            pipe.get(secret_words_controller.key_for(host_id))
+            host_is_active, queue_data = await pipe.execute()
+
+        if not host_already_active and host_is_active:
             raise AlreadyInGameError("You are already in game")
 
-        queue: SecretWordsQueue | None = await secret_words_controller.get(host_id)
+        queue: SecretWordsQueue | None = secret_words_controller.from_serialized(queue_data)
         if queue is None:
             queue = SecretWordsQueue.new(
                 host_id,
@@ -273,7 +360,7 @@ class MultiDeviceGame(AbstractRedisObject):
         if players is not None:
             game.players = players
 
-        game.players[host_id] = MultiDevicePlayer.new(
+        game.players[str(host_id)] = MultiDevicePlayer.new(
             user_id=host_id,
             telegram_id=telegram_id,
             first_name=first_name
@@ -281,26 +368,38 @@ class MultiDeviceGame(AbstractRedisObject):
 
         await game.save()
 
-        for player in game.players.values():
-            await MultiDeviceActivePlayer.new(
+        await players_controller.set_many(
+            MultiDeviceActivePlayer.new(
                 game_id=game.game_id,
                 user_id=player.user_id,
                 controller=players_controller
-            ).save()
+            )
+            for player in game.players.values()
+        )
 
         await queue.save()
 
         return game
 
-    async def unhost(self) -> None:
+    async def unhost(
+            self,
+            *,
+            except_host: bool = False
+    ) -> None:
         """
         Unhost an existing game.
 
         Clears a game object and all player objects from Redis.
+
+        :param except_host: Whether to keep the host's active player object,
+            e.g. when it is about to be overwritten by a rehost.
         """
 
-        for player in self.players.values():
-            await self.players_controller.remove(player.user_id)
+        await self.players_controller.remove_many(
+            player.user_id
+            for player in self.players.values()
+            if not (except_host and player.user_id == self.host_id)
+        )
 
         await self.clear()
 
@@ -322,9 +421,9 @@ class MultiDeviceGame(AbstractRedisObject):
         :return: New multi-device game instance.
         """
 
-        await game.unhost()
+        await game.unhost(except_host=True)
 
-        host: MultiDevicePlayer = game.players.get(game.host_id)
+        host: MultiDevicePlayer = game.players.get(str(game.host_id))
 
         return await cls.host(
             host.user_id,
@@ -336,7 +435,8 @@ class MultiDeviceGame(AbstractRedisObject):
             games_controller=game.controller,
             players_controller=game.players_controller,
             secret_words_controller=secret_words_controller,
-            players=game.players
+            players=game.players,
+            host_already_active=True
         )
 
     async def join(
@@ -359,14 +459,16 @@ class MultiDeviceGame(AbstractRedisObject):
         :raise InvalidPlayerAmountError: If a game has too many players.
         """
 
+        player_key: str = str(user_id)
+
         if self.has_started:
             raise GameHasAlreadyStartedError("Game has already started")
-        if user_id in self.players:
+        if player_key in self.players:
             raise AlreadyInGameError("You are already in game")
         if len(self.players) >= self.player_amount:
             raise InvalidPlayerAmountError("Game has too many players")
 
-        self.players[user_id] = MultiDevicePlayer.new(
+        self.players[player_key] = MultiDevicePlayer.new(
             user_id=user_id,
             telegram_id=telegram_id,
             first_name=first_name
@@ -378,8 +480,12 @@ class MultiDeviceGame(AbstractRedisObject):
             controller=self.players_controller
         )
 
-        await self.save()
-        await player.save()
+        # Both writes land in one MULTI/EXEC, so there is no window where
+        # the game lists the player but the active-player index misses them
+        async with self.controller.pipeline() as pipe:
+            self.controller.stage_set(pipe, self)
+            self.players_controller.stage_set(pipe, player)
+            await pipe.execute()
 
     async def leave(
             self,
@@ -394,13 +500,15 @@ class MultiDeviceGame(AbstractRedisObject):
         :raise NotInGameError: If a player has already left.
         """
 
-        if user_id not in self.players:
+        player_key: str = str(user_id)
+
+        if player_key not in self.players:
             raise NotInGameError("You are not in game")
 
-        self.players.pop(user_id)
+        self.players.pop(player_key)
 
         await self.players_controller.remove(user_id)
-        await self.save()
+        self.save_nowait()  # Recoverable by rehosting, no need to await the ACK
 
     async def start(self) -> None:
         """
@@ -425,7 +533,7 @@ class MultiDeviceGame(AbstractRedisObject):
             else:
                 player.role = PlayerRole.CITIZEN
 
-        await self.save()
+        await self.save_fields("has_started", "players")
 
     async def generate_qr_code(
             self,
@@ -439,7 +547,7 @@ class MultiDeviceGame(AbstractRedisObject):
         """
 
         qr_code = QRCode.new(
-            str(self.game_id),
+            self.game_id_str,
             b""
         )
 
@@ -447,10 +555,10 @@ class MultiDeviceGame(AbstractRedisObject):
             self.qr_code_url = await qr_codes_controller.url(qr_code.primary_key)
             return
 
-        task: AsyncResult = await asyncio.to_thread(generate_qr_code_task.delay, self.join_url)
+        task: AsyncResult = await run_in_dispatch_thread(generate_qr_code_task.delay, self.join_url)
         qr_code = QRCode.new(
-            str(self.game_id),
-            await asyncio.to_thread(task.get, timeout=10, **{})
+            self.game_id_str,
+            await run_in_dispatch_thread(task.get, timeout=10)
         )
 
         await qr_codes_controller.set(qr_code)
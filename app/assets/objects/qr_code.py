@@ -10,7 +10,7 @@ class QRCode(AbstractS3Object):
 
     bucket: ClassVar[str] = "qrcodes"
 
-    file_format: str = "jpg"
+    file_format: str = "png"
 
     @classmethod
     def new(
@@ -22,7 +22,7 @@ class QRCode(AbstractS3Object):
         Create a new QR-Code instance.
 
         :param name: Name of the QR-Code.
-        :param content: JPEG image of a QR-Code in a bytes object.
+        :param content: PNG image of a QR-Code in a bytes object.
         :return: QR-Code instance.
         """
 
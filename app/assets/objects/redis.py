@@ -1,5 +1,7 @@
 from abc import ABC
-from typing import ClassVar, TYPE_CHECKING, Any, Dict, Optional, Self
+from typing import ClassVar, TYPE_CHECKING, Any, Dict, Self
+
+from pydantic import PrivateAttr
 
 from app.assets.objects.abstract import AbstractObject
 
@@ -9,6 +11,35 @@ else:
     RedisController = Any
 
 
+class MissingController:
+    """
+    Sentinel standing in for an unset controller.
+
+    Any attribute access on it raises,
+    so controller properties can return the private attribute unconditionally
+    instead of guarding against None on every call.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        # Dunder probes (e.g. Pydantic looking up __set_name__ on defaults)
+        # must fail with a regular AttributeError
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+
+        raise ValueError("Controller is not set")
+
+    def __bool__(self) -> bool:
+        return False
+
+
+MISSING_CONTROLLER = MissingController()
+"""
+Shared sentinel instance used as a default for controller private attributes.
+"""
+
+
 class AbstractRedisObject(AbstractObject, ABC):
     """
     Abstract class for Redis objects.
@@ -27,9 +58,9 @@ class AbstractRedisObject(AbstractObject, ABC):
     Unique object class key.
     """
 
-    _controller: Optional['RedisController'] = None
+    _controller: 'RedisController' = PrivateAttr(default=MISSING_CONTROLLER)
     """
-    Redis controller instance.
+    Redis controller instance. Defaults to a sentinel which raises on any use.
     """
 
     @property
@@ -37,11 +68,10 @@ class AbstractRedisObject(AbstractObject, ABC):
         """
         Redis controller instance. A private parameter must be set after an object initialization.
 
-        :raise ValueError: If a controller instance is not set.
+        :raise ValueError: If a controller instance is not set, on first use.
         :return: Redis controller instance.
         """
-        if self._controller is None:
-            raise ValueError("Controller is not set")
+
         return self._controller
 
     @classmethod
@@ -77,6 +107,35 @@ class AbstractRedisObject(AbstractObject, ABC):
 
         await self.controller.set(self, expire=expire)
 
+    def save_nowait(self, *, expire: int | None = None) -> None:
+        """
+        Save an object to Redis without awaiting the acknowledgement.
+
+        Should only be used for objects which are recoverable if the write fails,
+        e.g. in-game state which can be rebuilt by rehosting.
+
+        :param expire: Expiration time in seconds.
+        """
+
+        self.controller.set_nowait(self, expire=expire)
+
+    async def save_fields(self, *field_names: str) -> None:
+        """
+        Save only the provided fields of an already stored object to Redis.
+
+        Falls back to a full save if the object is not stored yet.
+
+        :param field_names: Names of the fields to be saved.
+        """
+
+        updated: bool = await self.controller.set_fields(
+            self.primary_key,
+            self.model_dump(mode="json", include=set(field_names))
+        )
+
+        if not updated:
+            await self.save()
+
     async def clear(self) -> None:
         """
         Clear an object from Redis.
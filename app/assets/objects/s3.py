@@ -1,5 +1,7 @@
 from abc import ABC
-from typing import ClassVar
+from typing import Any, ClassVar
+
+from pydantic import PrivateAttr
 
 from app.assets.objects.abstract import AbstractObject
 
@@ -38,6 +40,22 @@ class AbstractS3Object(AbstractObject, ABC):
     Content of the file.
     """
 
+    _primary_key: str = PrivateAttr(default="")
+    """
+    File name with an extension, formatted once after an object initialization.
+    """
+
+    def model_post_init(
+            self,
+            context: Any
+    ) -> None:
+        """
+        Format a primary key after an object initialization,
+        so it is not reformatted on every S3 operation.
+        """
+
+        self._primary_key = f"{self.name}.{self.file_format}"
+
     @property
     def primary_key(self) -> str:
         """
@@ -45,4 +63,4 @@ class AbstractS3Object(AbstractObject, ABC):
         :return: File name as a string.
         """
 
-        return f"{self.name}.{self.file_format}"
+        return self._primary_key
@@ -1,11 +1,12 @@
+from collections import deque
 from random import choice
-from typing import Any, ClassVar, List, Set, Self
+from typing import Any, ClassVar, Deque, Dict, FrozenSet, List, Set, Tuple, Self
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from app.assets.controllers.redis import RedisController
-from app.assets.data.secret_words.secret_words import get_secret_words
+from app.assets.data.secret_words.secret_words import get_secret_words, get_secret_word_choices
 from app.assets.enums.category import Category
 from app.assets.objects.redis import AbstractRedisObject
 from config import config
@@ -18,14 +19,19 @@ class SecretWordsQueue(AbstractRedisObject):
 
     key: ClassVar[str] = "secret_words"
 
+    _recent_words: Set[str] = PrivateAttr(default_factory=set)
+    """
+    Membership set mirroring the secret words queue, updated incrementally.
+    """
+
     user_id: UUID
     """
     User UUID.
     """
 
-    secret_words: List[str] = Field(default_factory=list)
+    secret_words: Deque[str] = Field(default_factory=deque)
     """
-    List of last secret words.
+    Queue of last secret words, bounded to the guaranteed unique count.
     """
 
     guaranteed_unique_count: int = config.guaranteed_unique_words_count
@@ -33,6 +39,50 @@ class SecretWordsQueue(AbstractRedisObject):
     Count of guaranteed unique words.
     """
 
+    def model_post_init(
+            self,
+            context: Any
+    ) -> None:
+        """
+        Bound the secret words queue after an object initialization,
+        so appends evict the oldest word automatically,
+        and mirror it into a membership set.
+        """
+
+        if self.secret_words.maxlen != self.guaranteed_unique_count:
+            self.secret_words = deque(self.secret_words, maxlen=self.guaranteed_unique_count)
+
+        self._recent_words = set(self.secret_words)
+
+    @classmethod
+    def from_json(
+            cls,
+            data: Dict[str, Any],
+            **kwargs: Any
+    ) -> Self | None:
+        """
+        Reconstruct a secret words queue instance from a JSON-Serialized dictionary.
+
+        Data read back from Redis was serialized by this class, so it is
+        reconstructed with direct conversion instead of full Pydantic validation.
+        Anything unexpected falls back to the validated path.
+
+        :param data: Dictionary to reconstruct an object instance.
+        :param kwargs: Any additional JSON-Serializable parameters.
+        :return: An object instance if reconstructed successfully, else None.
+        """
+
+        data.update(kwargs)
+
+        try:
+            return cls.model_construct(
+                user_id=UUID(data["user_id"]),
+                secret_words=deque(data["secret_words"]),
+                guaranteed_unique_count=data["guaranteed_unique_count"]
+            )
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return super().from_json(data)
+
     @property
     def primary_key(self) -> Any:
         """
@@ -74,13 +124,25 @@ class SecretWordsQueue(AbstractRedisObject):
         :return: Secret word tag as a string.
         """
 
-        possible_words: Set[str] = get_secret_words(category)
-        available_words: Set[str] = possible_words - set(self.secret_words) or possible_words
+        choices: Tuple[str, ...] = get_secret_word_choices(category)
+        recent_words: Set[str] = self._recent_words
+
+        # Rejection sampling: the recent queue is tiny compared to the word pool,
+        # so a few cheap draws beat materializing the full set difference
+        for _ in range(10):
+            word: str = choice(choices)
+
+            if word not in recent_words:
+                break
+        else:
+            possible_words: FrozenSet[str] = get_secret_words(category)
+            available_words: FrozenSet[str] = possible_words - recent_words or possible_words
+            word: str = choice(list(available_words))
 
-        word: str = choice(list(available_words))
+        if len(self.secret_words) == self.secret_words.maxlen:
+            recent_words.discard(self.secret_words[0])  # The append below evicts this word
 
         self.secret_words.append(word)
-        if len(self.secret_words) > self.guaranteed_unique_count:
-            self.secret_words.pop(0)
+        recent_words.add(word)
 
         return word
@@ -1,4 +1,4 @@
-from typing import ClassVar, Self
+from typing import Any, ClassVar, Dict, Self
 from uuid import UUID
 
 from app.assets.controllers.redis import RedisController
@@ -22,6 +22,34 @@ class SingleDeviceActivePlayer(AbstractRedisObject):
     User UUID.
     """
 
+    @classmethod
+    def from_json(
+            cls,
+            data: Dict[str, Any],
+            **kwargs: Any
+    ) -> Self | None:
+        """
+        Reconstruct a single-device active player instance from a JSON-Serialized dictionary.
+
+        Data read back from Redis was serialized by this class, so it is
+        reconstructed with direct conversion instead of full Pydantic validation.
+        Anything unexpected falls back to the validated path.
+
+        :param data: Dictionary to reconstruct an object instance.
+        :param kwargs: Any additional JSON-Serializable parameters.
+        :return: An object instance if reconstructed successfully, else None.
+        """
+
+        data.update(kwargs)
+
+        try:
+            return cls.model_construct(
+                game_id=UUID(data["game_id"]),
+                user_id=UUID(data["user_id"])
+            )
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return super().from_json(data)
+
     @property
     def primary_key(self) -> UUID:
         """
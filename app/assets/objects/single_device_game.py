@@ -1,13 +1,13 @@
 from typing import ClassVar, Self, Dict, Any, Tuple
 from uuid import UUID, uuid4
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from app.api.v1.exceptions.already_in_game import AlreadyInGameError
 from app.assets.controllers.redis import RedisController
 from app.assets.enums.category import Category
 from app.assets.enums.spy_count import SpyCount
-from app.assets.objects.redis import AbstractRedisObject
+from app.assets.objects.redis import AbstractRedisObject, MISSING_CONTROLLER
 from app.assets.objects.secret_words_queue import SecretWordsQueue
 from app.assets.objects.single_device_active_player import SingleDeviceActivePlayer
 
@@ -19,9 +19,9 @@ class SingleDeviceGame(AbstractRedisObject):
 
     key: ClassVar[str] = "single_device_game"
 
-    _players_controller: RedisController[SingleDeviceActivePlayer] | None = None
+    _players_controller: RedisController[SingleDeviceActivePlayer] = PrivateAttr(default=MISSING_CONTROLLER)
     """
-    Redis controller instance for active players.
+    Redis controller instance for active players. Defaults to a sentinel which raises on any use.
     """
 
     user_id: UUID
@@ -70,6 +70,41 @@ class SingleDeviceGame(AbstractRedisObject):
         if self.spy_indices is None:
             self.spy_indices = self.spy_count.get_indices(self.player_amount)
 
+    @classmethod
+    def from_json(
+            cls,
+            data: Dict[str, Any],
+            **kwargs: Any
+    ) -> Self | None:
+        """
+        Reconstruct a single-device game instance from a JSON-Serialized dictionary.
+
+        Data read back from Redis was serialized by this class, so it is
+        reconstructed with direct conversion instead of full Pydantic validation.
+        Anything unexpected falls back to the validated path.
+
+        :param data: Dictionary to reconstruct an object instance.
+        :param kwargs: Any additional JSON-Serializable parameters.
+        :return: An object instance if reconstructed successfully, else None.
+        """
+
+        data.update(kwargs)
+
+        try:
+            spy_indices: Any = data["spy_indices"]
+
+            return cls.model_construct(
+                user_id=UUID(data["user_id"]),
+                player_amount=data["player_amount"],
+                secret_word=data["secret_word"],
+                category=Category(data["category"]),
+                spy_indices=None if spy_indices is None else tuple(spy_indices),
+                spy_count=SpyCount(data["spy_count"]),
+                game_id=UUID(data["game_id"])
+            )
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return super().from_json(data)
+
     @property
     def primary_key(self) -> UUID:
         """
@@ -84,12 +119,10 @@ class SingleDeviceGame(AbstractRedisObject):
         """
         Players controller instance. A private parameter must be set after an object initialization.
 
-        :raise ValueError: If a controller instance is not set.
+        :raise ValueError: If a controller instance is not set, on first use.
         :return: Players controller instance.
         """
 
-        if self._players_controller is None:
-            raise ValueError("Players controller is not set")
         return self._players_controller
 
     @classmethod
@@ -186,9 +219,6 @@ class SingleDeviceGame(AbstractRedisObject):
         :return: New single-device game instance.
         """
 
-        if await players_controller.exists(user_id):
-            raise AlreadyInGameError("You are already in game")
-
         queue: SecretWordsQueue | None = await secret_words_controller.get(user_id)
         if queue is None:
             queue = SecretWordsQueue.new(
@@ -207,15 +237,26 @@ class SingleDeviceGame(AbstractRedisObject):
             players_controller=players_controller
         )
 
-        await game.save(expire=3600)
-
-        await SingleDeviceActivePlayer.new(
+        player = SingleDeviceActivePlayer.new(
             game_id=game.game_id,
             user_id=user_id,
             controller=players_controller
-        ).save(expire=3600)
+        )
 
-        await queue.save()
+        # One atomic server-side round-trip: the active-player check and all
+        # three writes run in a single script, so there is no window for a
+        # concurrent host of the same user between the check and the saves
+        created: bool = await games_controller.set_many_unless_exists(
+            players_controller.key_for(user_id),
+            (
+                (games_controller.key_for(game.game_id), game.to_json_bytes(), 3600),
+                (players_controller.key_for(user_id), player.to_json_bytes(), 3600),
+                (secret_words_controller.key_for(user_id), queue.to_json_bytes(), None)
+            )
+        )
+
+        if not created:
+            raise AlreadyInGameError("You are already in game")
 
         return game
 
@@ -223,11 +264,13 @@ class SingleDeviceGame(AbstractRedisObject):
         """
         Unhost an existing game.
 
-        Clears a game object and player object from Redis.
+        Clears a game object and player object from Redis in a single round-trip.
         """
 
-        await self.players_controller.remove(self.user_id)
-        await self.clear()
+        await self.controller.redis.delete(
+            self.players_controller.key_for(self.user_id),
+            self.controller.key_for(self.primary_key)
+        )
 
     @classmethod
     async def rehost(
@@ -43,8 +43,13 @@ class Database:
             dsn,
             pool_size=10,
             max_overflow=10,
-            pool_recycle=60,
-            pool_timeout=10
+            # Recycling every minute forced constant TCP reconnects under idle load
+            pool_recycle=1800,
+            pool_timeout=10,
+            # With long-lived connections, a cheap ping catches ones dropped by the server
+            pool_pre_ping=True,
+            # Let psycopg server-side prepare a statement on its first reuse
+            connect_args={"prepare_threshold": 1}
         )
 
         session_maker = async_sessionmaker(
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, UUID, func, String, DateTime, BigInteger
+from sqlalchemy import Column, Index, UUID, func, text, String, DateTime, BigInteger
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -22,6 +22,16 @@ class User(Base):
 
     __tablename__ = "users"
 
+    __table_args__ = (
+        # Partial unique index: usernames are optional, so NULL rows stay out of the index
+        Index(
+            "ix_users_username",
+            "username",
+            unique=True,
+            postgresql_where=text("username IS NOT NULL")
+        ),
+    )
+
     id = Column(UUID(True), primary_key=True, server_default=func.gen_random_uuid())
     """
     UUID.
@@ -37,7 +47,7 @@ class User(Base):
     First name from telegram.
     """
 
-    username = Column(String(32), unique=True, nullable=True, default=None)
+    username = Column(String(32), nullable=True, default=None)
     """
     Username from telegram.
     """
@@ -1,12 +1,8 @@
-import json
 import logging
-from typing import Any, Dict
 
+from app.logging_config import CONFIG as API_LOG_CONFIG
 
-# Loading log config as a Dict.
-with open("app/logging.json", "r", encoding="utf-8") as f:
-    API_LOG_CONFIG: Dict[str, Any] = json.load(f)
-
+__all__ = ("API_LOG_CONFIG", "logger")
 
 # Main Logger instance.
 logger: logging.Logger = logging.getLogger("spotthespy")
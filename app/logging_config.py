@@ -1,11 +1,13 @@
-{
+from typing import Any, Dict
+
+CONFIG: Dict[str, Any] = {
     "version": 1,
-    "disable_existing_loggers": false,
+    "disable_existing_loggers": False,
     "formatters": {
         "default": {
             "()": "uvicorn.logging.DefaultFormatter",
             "fmt": "[%(asctime)s] %(levelprefix)s %(message)s",
-            "use_colors": null
+            "use_colors": None
         },
         "access": {
             "()": "uvicorn.logging.AccessFormatter",
@@ -25,9 +27,13 @@
         }
     },
     "loggers": {
-        "spotthespy": {"handlers": ["default"], "level": "INFO", "propagate": false},
-        "uvicorn": {"handlers": ["default"], "level": "INFO", "propagate": false},
+        "spotthespy": {"handlers": ["default"], "level": "INFO", "propagate": False},
+        "uvicorn": {"handlers": ["default"], "level": "INFO", "propagate": False},
         "uvicorn.error": {"level": "INFO"},
-        "uvicorn.access": {"handlers": ["access"], "level": "INFO", "propagate": false}
+        "uvicorn.access": {"handlers": ["access"], "level": "INFO", "propagate": False}
     }
 }
+"""
+dictConfig-style log config. Kept as a plain dict literal,
+so importing it costs no disk read or parse.
+"""
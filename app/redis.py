@@ -0,0 +1,37 @@
+from redis.asyncio import ConnectionPool, Redis
+
+
+def create_redis_pool(
+        dsn: str,
+        *,
+        max_connections: int = 64
+) -> ConnectionPool:
+    """
+    Create the shared Redis connection pool.
+
+    One pool per process is intended: every controller attaches to it,
+    so multi-controller flows reuse already-open TCP connections.
+    Responses are left as bytes, which orjson decodes directly
+    without an intermediate str pass.
+
+    :param dsn: Redis DSN string.
+    :param max_connections: Maximum count of open connections in the pool.
+    :return: Connection pool instance.
+    """
+
+    return ConnectionPool.from_url(
+        dsn,
+        max_connections=max_connections,
+        decode_responses=False
+    )
+
+
+def create_redis(pool: ConnectionPool) -> Redis:
+    """
+    Create a Redis connection instance on a shared connection pool.
+
+    :param pool: Connection pool instance.
+    :return: Redis connection instance.
+    """
+
+    return Redis(connection_pool=pool)
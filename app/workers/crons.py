@@ -1,6 +1,11 @@
-from asyncio import run, sleep
+from asyncio import AbstractEventLoop, Semaphore, gather
 from typing import Tuple, List
 
+try:
+    from uvloop import new_event_loop
+except ImportError:  # uvloop ships no Windows builds, the stock loop is fine there
+    from asyncio import new_event_loop
+
 from redis.asyncio import Redis
 
 from app.assets.controllers.redis import RedisController
@@ -8,61 +13,129 @@ from app.assets.controllers.s3 import S3Config, S3Controller
 from app.assets.objects.multi_device_active_player import MultiDeviceActivePlayer
 from app.assets.objects.multi_device_game import MultiDeviceGame
 from app.assets.objects.qr_code import QRCode
+from app.redis import create_redis, create_redis_pool
 from app.workers.worker import worker, config
 
+_loop: AbstractEventLoop | None = None
+"""
+Long-lived event loop shared by every cron invocation in the worker process.
+"""
+
+_multi_device_games: RedisController[MultiDeviceGame] | None = None
+"""
+Lazily created multi-device games controller reused across cron invocations.
+"""
+
+_multi_device_players: RedisController[MultiDeviceActivePlayer] | None = None
+"""
+Lazily created active players controller reused across cron invocations.
+"""
+
+_qr_codes: S3Controller[QRCode] | None = None
+"""
+Lazily created QR-Codes controller reused across cron invocations.
+"""
+
+
+def _get_loop() -> AbstractEventLoop:
+    """
+    Retrieve the shared worker event loop, creating it on the first cron invocation.
+
+    Reusing one loop keeps the cached async connections usable between runs.
+
+    :return: Event loop instance.
+    """
+
+    global _loop
+
+    if _loop is None:
+        _loop = new_event_loop()
+
+    return _loop
+
+
+def _get_controllers() -> Tuple[
+    RedisController[MultiDeviceGame],
+    RedisController[MultiDeviceActivePlayer],
+    S3Controller[QRCode]
+]:
+    """
+    Retrieve the shared cleanup controllers,
+    creating them with their connections on the first cron invocation.
+
+    :return: Multi-device games, active players, and QR-Codes controller instances.
+    """
+
+    global _multi_device_games, _multi_device_players, _qr_codes
+
+    if _multi_device_games is None:
+        redis: Redis = create_redis(
+            create_redis_pool(config.redis_dsn.get_secret_value(), max_connections=20)
+        )
+        s3_config = S3Config.from_config(config)
+
+        _multi_device_games = RedisController[MultiDeviceGame](redis)
+        _multi_device_players = RedisController[MultiDeviceActivePlayer](redis)
+        _qr_codes = S3Controller[QRCode](s3_config)
+
+    return _multi_device_games, _multi_device_players, _qr_codes
+
 
 async def __async_cleanup() -> None:
     """
     Asynchronously clean up unused data and files.
     """
 
-    redis = Redis.from_url(config.redis_dsn.get_secret_value())
-    s3_config = S3Config(
-        config.s3_dsn.get_secret_value(),
-        config.s3_region,
-        config.s3_username.get_secret_value(),
-        config.s3_password.get_secret_value(),
-        config.s3_remote_dsn.get_secret_value() if config.s3_remote_dsn is not None else None
-    )
-
-    multi_device_games = RedisController[MultiDeviceGame](redis)
-    multi_device_players = RedisController[MultiDeviceActivePlayer](redis)
-    qr_codes = S3Controller[QRCode](s3_config)
+    multi_device_games, multi_device_players, qr_codes = _get_controllers()
 
     games: List[MultiDeviceGame] = []
-    limit: int = 10
-    offset: int = 0
 
     # Filling a list with all multi-device games to later detect unused ones and cleanup them
-    while True:
-        new_games: Tuple[MultiDeviceGame, ...] = await multi_device_games.all(
-            limit=limit,
-            offset=offset,
+    async for batch in multi_device_games.iter_all(
             players_controller=multi_device_players,
             from_json_method=MultiDeviceGame.from_json_and_controllers
-        )
+    ):
+        games.extend(batch)
 
-        await sleep(0.25)
+    if not games:
+        return
 
-        if not new_games:
-            break
+    # All host existence checks are batched into one round-trip
+    # instead of one GET per game
+    async with multi_device_players.pipeline(transaction=False) as pipe:
+        for game in games:
+            pipe.exists(multi_device_players.key_for(game.host_id))
 
-        games.extend(new_games)
-        offset += limit
+        host_present: List[int] = await pipe.execute()
 
     # Removing all games where there are no players left or the host is no longer present
-    for game in games:
-        if not game.players or await multi_device_players.get(game.host_id) is None:
+    stale: List[MultiDeviceGame] = [
+        game
+        for game, present in zip(games, host_present)
+        if not game.players or not present
+    ]
+
+    if not stale:
+        return
+
+    # Bounded concurrency keeps Redis from being flooded
+    # when a large backlog of stale games builds up
+    semaphore = Semaphore(10)
+
+    async def unhost(game: MultiDeviceGame) -> None:
+        async with semaphore:
             await game.unhost()
-            await qr_codes.remove(QRCode.new(str(game.game_id), b"").primary_key)
 
-            await sleep(1)
+    await gather(*map(unhost, stale))
+    await qr_codes.remove_many(
+        [QRCode.new(str(game.game_id), b"").primary_key for game in stale]
+    )
 
 
-@worker.task(name="cleanup")
+@worker.task(name="cleanup", time_limit=300, soft_time_limit=270)
 def cleanup() -> None:
     """
     Celery task for cleaning up unused data and files.
     """
 
-    run(__async_cleanup())
+    _get_loop().run_until_complete(__async_cleanup())
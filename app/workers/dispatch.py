@@ -0,0 +1,32 @@
+from asyncio import get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+T = TypeVar('T')
+
+# Single long-lived thread for all Celery broker operations.
+# Kombu caches its broker connection per thread, so publishing and result
+# polling from one dedicated thread reuses a single open connection instead
+# of churning through the event loop's shared default executor.
+_dispatch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="celery-dispatch")
+
+
+async def run_in_dispatch_thread(
+        function: Callable[..., T],
+        *args: Any,
+        **kwargs: Any
+) -> T:
+    """
+    Execute a blocking Celery operation on the dedicated dispatch thread.
+
+    :param function: Blocking function to be executed, e.g. task.delay or result.get.
+    :param args: Positional arguments for the function.
+    :param kwargs: Keyword arguments for the function.
+    :return: Function result.
+    """
+
+    return await get_running_loop().run_in_executor(
+        _dispatch_executor,
+        partial(function, *args, **kwargs)
+    )
@@ -1,11 +1,37 @@
+from functools import lru_cache
+from hashlib import blake2b
 from io import BytesIO
-from typing import Tuple
+from typing import List, Tuple
 
-from PIL import Image, ImageOps
+from PIL import Image, ImageColor, ImageOps
 from PIL.ImageDraw import Draw
+from redis import Redis
+from redis.exceptions import RedisError
 from segno import QRCode, make
 
-from app.workers.worker import worker
+from app.logging import logger
+from app.workers.worker import worker, config
+
+_qr_cache: Redis | None = None
+"""
+Lazily created Redis connection reused across task invocations for caching rendered QR-Codes.
+"""
+
+
+def _get_qr_cache() -> Redis:
+    """
+    Retrieve the shared Redis connection for the QR-Code cache,
+    creating it on the first task invocation.
+
+    :return: Redis connection instance.
+    """
+
+    global _qr_cache
+
+    if _qr_cache is None:
+        _qr_cache = Redis.from_url(config.redis_dsn.get_secret_value())
+
+    return _qr_cache
 
 
 class QRCodeGenerator:
@@ -37,7 +63,7 @@ class QRCodeGenerator:
         self.fill_color = fill_color or "#050B10"
         self.back_color = back_color or "#F0F0F0"
         self.pixel_size = pixel_size or 14
-        self.radius = radius or 6
+        self.radius = 6 if radius is None else radius
         self.border = border or 4
         self.error = error or "Q"
 
@@ -55,85 +81,189 @@ class QRCodeGenerator:
         buffer = BytesIO()
 
         qr: QRCode = make(url, self.error)
+
+        # Square units need no cosmetic pass,
+        # so segno's native PNG writer streams the image directly
+        if not self.radius:
+            qr.save(
+                buffer,
+                kind="png",
+                scale=self.pixel_size,
+                border=self.border,
+                dark=self.fill_color,
+                light=self.back_color
+            )
+
+            buffer.seek(0)
+            return buffer.read()
+
         matrix: Tuple[bytearray, ...] = qr.matrix
 
-        # Creating plain image
-        image_size: int = len(matrix) * self.pixel_size
-        image = Image.new("RGB", (image_size, image_size), self.back_color)
-        draw = Draw(image)
+        # Creating plain image: a two-color QR only needs a 2-entry palette,
+        # which keeps the raster at 1 byte per pixel instead of 3
+        matrix_size: int = len(matrix)
+        image_size: int = matrix_size * self.pixel_size
+        image = Image.new("P", (image_size, image_size), 0)
+
+        # Padding the matrix with an empty frame once lets the inner loop
+        # read all four neighbours by plain indexing, with no bounds checks
+        empty_row: bytes = bytes(matrix_size + 2)
+        padded: Tuple[bytes, ...] = (
+            empty_row,
+            *(b"\x00%b\x00" % bytes(row) for row in matrix),
+            empty_row
+        )
+
+        # Every filled unit is one of 16 neighbour combinations,
+        # so each is rendered once and stamped with a single paste per unit
+        tiles: Tuple[Image.Image, ...] = _build_tiles(self.pixel_size, self.radius)
+        pixel_size: int = self.pixel_size
+
+        for y in range(matrix_size):
+            row_above, row, row_below = padded[y], padded[y + 1], padded[y + 2]
+
+            for x in range(matrix_size):
+                if row[x + 1]:
+                    mask: int = (
+                        row[x + 2]
+                        | row[x] << 1
+                        | row_below[x + 1] << 2
+                        | row_above[x + 1] << 3
+                    )
+                    image.paste(tiles[mask], (x * pixel_size, y * pixel_size))
 
-        for y, row in enumerate(matrix):
-            for x, pixel in enumerate(row):
-                if pixel:
-                    self._draw_filled_pixel(draw, matrix, x, y)  # Draw rounded square unit for each QR-Code unit
+        image.putpalette(
+            (*ImageColor.getrgb(self.back_color), *ImageColor.getrgb(self.fill_color))
+        )
 
         # Creating border
         ImageOps.expand(
             image,
             border=self.border * self.pixel_size,
-            fill=self.back_color
-        ).save(buffer, format="JPEG")
+            fill=0
+        ).save(
+            buffer,
+            format="PNG",
+            # A light compression level already shrinks flat line-art well,
+            # so heavier passes would only cost encode CPU
+            compress_level=1,
+            optimize=False
+        )
 
         buffer.seek(0)
         return buffer.read()
 
-    def _draw_filled_pixel(
-            self,
-            draw: Draw,
-            matrix: Tuple[bytearray, ...],
-            x: int,
-            y: int
-    ) -> None:
-        """
-        Draw rounded square unit in respect to neighbouring units.
 
-        :param draw: Image draw object.
-        :param matrix: QR-Code matrix.
-        :param x: X coordinate of a unit.
-        :param y: Y coordinate of a unit.
-        """
+@lru_cache(maxsize=32)
+def _build_tiles(
+        pixel_size: int,
+        radius: int
+) -> Tuple[Image.Image, ...]:
+    """
+    Pre-render a square unit tile for every neighbour combination.
+
+    Tiles are indexed by a 4-bit mask of filled neighbours:
+    bit 0 is right, bit 1 is left, bit 2 is down, bit 3 is up.
+    Tiles hold palette indices (0 background, 1 fill), so one tile set
+    serves every color scheme. Memoized per shape, so repeated renders
+    reuse the same tiles.
+
+    :param pixel_size: Length in pixels of all QR-Code square units.
+    :param radius: Radius of unit roundness.
+    :return: Tuple of 16 unit tiles.
+    """
 
-        # Retrieving all required coordinates by splitting one unit into 4 parts
-        x0, y0 = x * self.pixel_size, y * self.pixel_size
-        x1, y1 = (x + 0.5) * self.pixel_size - 1, (y + 0.5) * self.pixel_size - 1
-        x2, y2 = (x + 0.5) * self.pixel_size, (y + 0.5) * self.pixel_size
-        x3, y3 = (x + 1) * self.pixel_size - 1, (y + 1) * self.pixel_size - 1
+    tiles: List[Image.Image] = []
+
+    # Retrieving all required coordinates by splitting one unit into 4 parts
+    x1 = y1 = 0.5 * pixel_size - 1
+    x2 = y2 = 0.5 * pixel_size
+    x3 = y3 = pixel_size - 1
+
+    for mask in range(16):
+        tile = Image.new("P", (pixel_size, pixel_size), 0)
+        draw = Draw(tile)
 
         # Drawing a rounded rectangle as a base square unit
-        draw.rounded_rectangle((x0, y0, x3, y3), radius=self.radius, fill=self.fill_color)
+        draw.rounded_rectangle((0, 0, x3, y3), radius=radius, fill=1)
 
         # Completing corners with neighbouring filled units
-        if self._is_filled(matrix, x + 1, y):
-            draw.rectangle((x2, y0, x3, y3), fill=self.fill_color)
-        if self._is_filled(matrix, x - 1, y):
-            draw.rectangle((x0, y0, x1, y3), fill=self.fill_color)
-        if self._is_filled(matrix, x, y + 1):
-            draw.rectangle((x0, y2, x3, y3), fill=self.fill_color)
-        if self._is_filled(matrix, x, y - 1):
-            draw.rectangle((x0, y0, x3, y1), fill=self.fill_color)
-
-    @staticmethod
-    def _is_filled(
-            matrix: Tuple[bytearray, ...],
-            x: int,
-            y: int
-    ) -> bool:
-        """
-        Check if a QR-Code square unit is filled without an index error.
+        if mask & 1:
+            draw.rectangle((x2, 0, x3, y3), fill=1)
+        if mask & 2:
+            draw.rectangle((0, 0, x1, y3), fill=1)
+        if mask & 4:
+            draw.rectangle((0, y2, x3, y3), fill=1)
+        if mask & 8:
+            draw.rectangle((0, 0, x3, y1), fill=1)
 
-        :param matrix: QR-Code matrix.
-        :param x: X coordinate of a unit.
-        :param y: Y coordinate of a unit.
-        :return: Is unit filled.
-        """
+        tiles.append(tile)
 
-        if x < 0 or y < 0 or x >= len(matrix) or y >= len(matrix):
-            return False
+    return tuple(tiles)
 
-        return matrix[y][x]
 
+@lru_cache(maxsize=1024)
+def _generate_cached(
+        url: str,
+        fill_color: str | None,
+        back_color: str | None,
+        pixel_size: int | None,
+        radius: int | None,
+        border: int | None,
+        error: str | None
+) -> bytes:
+    """
+    Generate a QR-Code behind a two-tier cache.
 
-@worker.task()
+    The lru_cache on this function is the in-process tier: a repeat of
+    the same URL and style in one worker process returns without any
+    I/O. Rendered bytes are also kept in Redis, so sibling worker
+    processes skip the render as well.
+
+    :param url: URL for QR-Code generation.
+    :param fill_color: Color of the QR-Code in HEX format, can be None.
+    :param back_color: Color of the background in HEX format, can be None.
+    :param pixel_size: Length in pixels of all QR-Code square units, can be None.
+    :param radius: Radius of unit roundness, can be None.
+    :param border: Distance from border to QR-Code in square units, can be None.
+    :param error: QR-Code generation error, can be None.
+    :return: Generated QR-Code as a bytes object.
+    """
+
+    # The same URL and style always render the same image,
+    # so rendered bytes are cached in Redis for the game lifetime
+    style: str = f"{url}|{fill_color}|{back_color}|{pixel_size}|{radius}|{border}|{error}"
+    cache_key: str = f"{config.default_redis_key}:qr_cache:{blake2b(style.encode(), digest_size=16).hexdigest()}"
+
+    try:
+        cached: bytes | None = _get_qr_cache().get(cache_key)
+    except RedisError as cache_error:
+        logger.exception(cache_error)
+        cached = None
+
+    if cached is not None:
+        return cached
+
+    generator = QRCodeGenerator(
+        fill_color=fill_color,
+        back_color=back_color,
+        pixel_size=pixel_size,
+        radius=radius,
+        border=border,
+        error=error
+    )
+
+    content: bytes = generator.generate(url)
+
+    try:
+        _get_qr_cache().setex(cache_key, 3600, content)
+    except RedisError as cache_error:
+        logger.exception(cache_error)
+
+    return content
+
+
+@worker.task(time_limit=60, soft_time_limit=45)
 def generate_qr_code_task(
         url: str,
         *,
@@ -157,13 +287,4 @@ def generate_qr_code_task(
     :return: Generated QR-Code as a bytes object.
     """
 
-    generator = QRCodeGenerator(
-        fill_color=fill_color,
-        back_color=back_color,
-        pixel_size=pixel_size,
-        radius=radius,
-        border=border,
-        error=error
-    )
-
-    return generator.generate(url)
+    return _generate_cached(url, fill_color, back_color, pixel_size, radius, border, error)
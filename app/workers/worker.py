@@ -1,9 +1,7 @@
 from celery import Celery
 from celery.schedules import crontab
 
-from config import Config
-
-config = Config(_env_file=".env")
+from config import config
 
 
 def create_worker() -> Celery:
@@ -21,8 +19,9 @@ def create_worker() -> Celery:
     )
 
     celery.conf.update(
-        task_time_limit=30,
-        worker_max_tasks_per_child=100
+        # Time limits are set per task; with module-cached clients
+        # there is nothing left to leak, so children recycle rarely
+        worker_max_tasks_per_child=1000
     )
 
     celery.conf.beat_schedule = {
@@ -0,0 +1,36 @@
+"""Make users username index partial
+
+Revision ID: 7d42a91c03e8
+Revises: c1e537b7fd70
+Create Date: 2026-08-31 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d42a91c03e8'
+down_revision: Union[str, Sequence[str], None] = 'c1e537b7fd70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint(op.f('users_username_key'), 'users', type_='unique')
+    op.create_index(
+        op.f('ix_users_username'),
+        'users',
+        ['username'],
+        unique=True,
+        postgresql_where=sa.text('username IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_users_username'), table_name='users')
+    op.create_unique_constraint(op.f('users_username_key'), 'users', ['username'])